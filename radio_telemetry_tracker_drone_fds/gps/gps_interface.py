@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import datetime as dt
 import logging
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
-import pynmea2
+import serial
+import smbus2
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -21,7 +21,7 @@ class GPSInterface(ABC):
     """Abstract base class for GPS communication interfaces."""
 
     @abstractmethod
-    def read_gps_data(self, total_length: int = 32) -> list[int] | None:
+    def read_gps_data(self, total_length: int = 32) -> bytes | None:
         """Read GPS data from the interface."""
 
 
@@ -30,15 +30,13 @@ class I2CGPSInterface(GPSInterface):
 
     def __init__(self, bus_number: int, address: int) -> None:
         """Initialize I2C GPS interface."""
-        import smbus2
-
         self._bus = smbus2.SMBus(bus_number)
         self._address = address
 
-    def read_gps_data(self, total_length: int = 32) -> list[int] | None:
+    def read_gps_data(self, total_length: int = 32) -> bytes | None:
         """Read GPS data from I2C interface."""
         try:
-            return self._bus.read_i2c_block_data(self._address, 0xFF, total_length)
+            return bytes(self._bus.read_i2c_block_data(self._address, 0xFF, total_length))
         except OSError:
             logger.exception("Error reading GPS data over I2C")
             return None
@@ -49,17 +47,12 @@ class SerialGPSInterface(GPSInterface):
 
     def __init__(self, port: str, baudrate: int) -> None:
         """Initialize Serial GPS interface."""
-        import serial
-
         self._serial_port = serial.Serial(port, baudrate, timeout=1)
 
-    def read_gps_data(self, total_length: int = 32) -> list[int] | None:
+    def read_gps_data(self, total_length: int = 32) -> bytes | None:
         """Read GPS data from Serial interface."""
-        import serial
-
         try:
-            data = self._serial_port.read(total_length)
-            return list(data)
+            return self._serial_port.read(total_length)
         except serial.SerialException:
             logger.exception("Error reading GPS data over Serial")
             return None
@@ -75,41 +68,62 @@ class SimulatedGPSInterface(GPSInterface):
         self._data_generator = self._generate_simulated_data()
         self._logger = logging.getLogger(__name__)
 
-    def _generate_simulated_data(self) -> Generator[list[int], None, None]:
+    def _generate_simulated_data(self) -> Generator[bytes, None, None]:
         """Generate simulated GPS data."""
         lat = 32.7157  # Starting latitude (e.g., San Diego, CA)
         lon = -117.1611  # Starting longitude
         altitude = 20
 
+        # Hoist the per-tick lookups out of the loop; these never change for
+        # the lifetime of the generator.
+        start_time = self._start_time
+        speed = self._simulation_speed
+        interval = 1 / speed
+        now = time.time
+        sleep = time.sleep
+        monotonic = time.monotonic
+
+        # Pace against a running deadline rather than sleeping a fixed
+        # interval after each yield, so generation time does not accumulate
+        # as drift and the effective rate tracks simulation_speed.
+        next_deadline = monotonic()
+
         while True:
             sentences = None
             # Try to generate sentences, if it fails, log and continue
             try:
-                sentences = self._generate_sentences(lat, lon, altitude)
+                elapsed_time = (now() - start_time) * speed
+                sentences = self._generate_sentences(
+                    lat + 0.0001 * elapsed_time,
+                    lon + 0.0001 * elapsed_time,
+                    altitude + 0.01 * elapsed_time,  # Ascend at 0.1m/s
+                )
             except Exception:
                 self._logger.exception("Error generating simulated GPS data")
-                time.sleep(1)
+                sleep(1)
                 continue
 
             # Only proceed if we have valid sentences
             if sentences:
-                data = [ord(c) for c in sentences]
-                yield data
-                time.sleep(1 / self._simulation_speed)
-
-    def _generate_sentences(self, lat: float, lon: float, altitude: float) -> str:
-        """Generate NMEA sentences for simulated GPS data."""
-        elapsed_time = (time.time() - self._start_time) * self._simulation_speed
-        current_lat = lat + 0.0001 * elapsed_time
-        current_lon = lon + 0.0001 * elapsed_time
-        current_alt = altitude + 0.01 * elapsed_time  # Ascend at 0.1m/s
-
-        # Time in HHMMSS format
-        now = dt.datetime.now(tz=dt.timezone.utc)
-        time_str = now.strftime("%H%M%S.%f")[:-3]
-
-        # Date in ddmmyy format
-        date_str = now.strftime("%d%m%y")
+                yield sentences.encode("ascii")
+                next_deadline += interval
+                delay = next_deadline - monotonic()
+                if delay > 0:
+                    sleep(delay)
+                else:
+                    # Fell behind (e.g. a slow consumer); reset the deadline
+                    # instead of bursting to catch up.
+                    next_deadline = monotonic()
+
+    def _generate_sentences(self, current_lat: float, current_lon: float, current_alt: float) -> str:
+        """Generate NMEA sentences for the given simulated position."""
+        # Time (HHMMSS.sss) and date (ddmmyy) straight from the epoch clock;
+        # time.gmtime is far cheaper than a tz-aware datetime plus strftime.
+        now = time.time()
+        tm = time.gmtime(now)
+        millis = int((now % 1) * 1000)
+        time_str = f"{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}.{millis:03d}"
+        date_str = f"{tm.tm_mday:02d}{tm.tm_mon:02d}{tm.tm_year % 100:02d}"
 
         # Speed over ground in knots (we can set to a fixed value or calculate)
         speed_over_ground = "0.5"  # knots
@@ -117,57 +131,46 @@ class SimulatedGPSInterface(GPSInterface):
         # Track angle in degrees
         track_angle = "054.7"
 
-        # Create NMEA sentences using pynmea2
-        gga_msg = pynmea2.GGA(
-            "GP",
-            "GGA",
-            (
-                time_str,
-                self._format_nmea_lat_lon(current_lat, "lat"), self._lat_dir(current_lat),
-                self._format_nmea_lat_lon(current_lon, "lon"), self._lon_dir(current_lon),
-                "1",  # GPS quality indicator
-                "08",  # Number of satellites in use
-                "0.9",  # Horizontal dilution of precision
-                f"{current_alt:.1f}", "M",  # Altitude above mean sea level
-                "0.0", "M",  # Height of geoid above WGS84 ellipsoid
-                "",  # Time since last DGPS update
-                "",   # DGPS reference station id
-            ),
+        lat_str = self._fmt_lat(current_lat)
+        lon_str = self._fmt_lon(current_lon)
+        lat_dir = self._lat_dir(current_lat)
+        lon_dir = self._lon_dir(current_lon)
+
+        # Assemble the sentences directly; the message layout is fixed, so
+        # pynmea2's per-field message objects are unnecessary here.
+        gga_body = (
+            f"GPGGA,{time_str},{lat_str},{lat_dir},{lon_str},{lon_dir},"
+            f"1,08,0.9,{current_alt:.1f},M,0.0,M,,"
         )
-        gga_sentence = gga_msg.render()
-
-        rmc_msg = pynmea2.RMC(
-            "GP",
-            "RMC",
-            (
-                time_str,
-                "A",  # Status
-                self._format_nmea_lat_lon(current_lat, "lat"), self._lat_dir(current_lat),
-                self._format_nmea_lat_lon(current_lon, "lon"), self._lon_dir(current_lon),
-                speed_over_ground,  # Speed over ground in knots
-                track_angle,  # Track angle in degrees
-                date_str,  # Date in ddmmyy format
-                "",  # Magnetic variation
-                "",   # Magnetic variation direction
-            ),
+        rmc_body = (
+            f"GPRMC,{time_str},A,{lat_str},{lat_dir},{lon_str},{lon_dir},"
+            f"{speed_over_ground},{track_angle},{date_str},,"
         )
-        rmc_sentence = rmc_msg.render()
-
-        return gga_sentence + "\r\n" + rmc_sentence + "\r\n"
-
-    def _format_nmea_lat_lon(self, coord: float, coord_type: str) -> str:
-        """Format latitude or longitude in NMEA format."""
-        if coord_type == "lat":
-            degrees = int(abs(coord))
-            minutes = (abs(coord) - degrees) * 60
-            return f"{degrees:02d}{minutes:07.4f}"
-        if coord_type == "lon":
-            degrees = int(abs(coord))
-            minutes = (abs(coord) - degrees) * 60
-            return f"{degrees:03d}{minutes:07.4f}"
-        msg = "coord_type must be 'lat' or 'lon'"
-        self._logger.error(msg)
-        raise ValueError(msg)
+
+        return (
+            f"${gga_body}*{self._nmea_checksum(gga_body):02X}\r\n"
+            f"${rmc_body}*{self._nmea_checksum(rmc_body):02X}\r\n"
+        )
+
+    @staticmethod
+    def _nmea_checksum(body: str) -> int:
+        """Compute the NMEA checksum (XOR of all body bytes)."""
+        checksum = 0
+        for byte in body.encode("ascii"):
+            checksum ^= byte
+        return checksum
+
+    @staticmethod
+    def _fmt_lat(coord: float) -> str:
+        """Format a latitude in NMEA ddmm.mmmm form."""
+        degrees, minutes = divmod(abs(coord) * 60, 60)
+        return f"{int(degrees):02d}{minutes:07.4f}"
+
+    @staticmethod
+    def _fmt_lon(coord: float) -> str:
+        """Format a longitude in NMEA dddmm.mmmm form."""
+        degrees, minutes = divmod(abs(coord) * 60, 60)
+        return f"{int(degrees):03d}{minutes:07.4f}"
 
     def _lat_dir(self, lat: float) -> str:
         return "N" if lat >= 0 else "S"
@@ -175,7 +178,7 @@ class SimulatedGPSInterface(GPSInterface):
     def _lon_dir(self, lon: float) -> str:
         return "E" if lon >= 0 else "W"
 
-    def read_gps_data(self, _: int = 128) -> list[int] | None:
+    def read_gps_data(self, _: int = 128) -> bytes | None:
         """Read simulated GPS data."""
         try:
             return next(self._data_generator)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import queue
 import threading
 import time
 from typing import TYPE_CHECKING
@@ -19,6 +21,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# State strings compared on every fix; resolved once instead of going
+# through the Enum.value descriptor per comparison.
+_STATE_RUNNING = GPSState.RUNNING.value
+_STATE_INITIALIZING = GPSState.INITIALIZING.value
+
+# Bounded hand-off between the reader thread and the parse loop; at 32-byte
+# chunks this is about two seconds of backlog before chunks are dropped.
+_READ_QUEUE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(epsg_code: int) -> pyproj.Transformer:
+    """Return the WGS84-to-target transformer for the given EPSG code.
+
+    Transformer construction costs ~100 ms and ~1 MB, so instances are
+    cached and shared across GPSModule instantiations.
+    """
+    return pyproj.Transformer.from_crs("epsg:4326", f"epsg:{epsg_code}", always_xy=True)
+
 
 class GPSModule:
     """Handles GPS data acquisition and processing using a GPS interface."""
@@ -30,18 +51,23 @@ class GPSModule:
         """Initialize the GPS module with a GPS interface."""
         self._gps_interface = gps_interface
         self._state_manager = state_manager
-        self._buffer = ""
-        self._running = threading.Event()
+        self._buffer = bytearray()
+        self._stop_event = threading.Event()
+        self._read_queue: queue.Queue[bytes] = queue.Queue(maxsize=_READ_QUEUE_SIZE)
         self._error_count = 0
         self._max_errors = 5
         self._epsg_code = epsg_code
-        self._transformer = pyproj.Transformer.from_crs("epsg:4326", f"epsg:{self._epsg_code}", always_xy=True)
+        self._transformer = _get_transformer(epsg_code)
         self._last_update_time = time.time()
+        # (lat, lon, easting, northing) of the last transformed fix; hovering
+        # or grounded craft repeat coordinates, so the PROJ call is skipped
+        # when the position has not moved.
+        self._last_transform: tuple[float, float, float, float] | None = None
 
         # Set to IDLE after initialization
         self._state_manager.set_gps_state(GPSState.IDLE)
 
-    def _read_gps_data(self, total_length: int = 32) -> list[int] | None:
+    def _read_gps_data(self, total_length: int = 32) -> bytes | None:
         data = self._gps_interface.read_gps_data(total_length)
         if data is None:
             self._error_count += 1
@@ -54,16 +80,30 @@ class GPSModule:
 
     def _process_buffer(self) -> None:
         """Process the current buffer to extract and parse NMEA sentences."""
-        sentences = self._buffer.split("\n")
-        self._buffer = sentences[-1]  # Keep the incomplete sentence
-        sentences = sentences[:-1]  # Process complete sentences
-
-        data_updated, new_gps_data = self._process_sentences(sentences)
+        # Split off the complete sentences in place; the incomplete tail
+        # stays in the bytearray so reads append without re-copying it.
+        end = self._buffer.rfind(b"\n")
+        data_updated = False
+        new_gps_data = None
+        if end != -1:
+            complete = bytes(self._buffer[:end])
+            del self._buffer[: end + 1]
+            try:
+                sentences = complete.decode("ascii").split("\n")
+            except UnicodeDecodeError:
+                logger.warning("Received non-ASCII data from GPS interface")
+            else:
+                data_updated, new_gps_data = self._process_sentences(sentences)
 
         if data_updated and new_gps_data:
             self._update_gps_data(new_gps_data)
-        elif (time.time() - self._last_update_time > self.GPS_DATA_TIMEOUT and
-              self._state_manager.get_gps_state() == GPSState.RUNNING.value):
+        else:
+            self._check_data_timeout()
+
+    def _check_data_timeout(self) -> None:
+        """Fall back to INITIALIZING when no fix has arrived recently."""
+        if (time.time() - self._last_update_time > self.GPS_DATA_TIMEOUT and
+              self._state_manager.get_gps_state() == _STATE_RUNNING):
             # If we timeout waiting for data, stay in INITIALIZING state
             self._state_manager.set_gps_state(GPSState.INITIALIZING)
 
@@ -75,11 +115,22 @@ class GPSModule:
             stripped_sentence = sentence.strip()
             if not stripped_sentence:
                 continue
+            # Cheap framing check: a valid NMEA sentence starts with '$' and
+            # carries a '*XX' checksum trailer. Rejecting noise here avoids
+            # paying for a pynmea2 ParseError on every garbage line.
+            if not stripped_sentence.startswith("$") or stripped_sentence.rfind("*") != len(stripped_sentence) - 3:
+                logger.warning("Discarding malformed NMEA sentence: %s", sentence)
+                continue
+            # Only GGA and RMC carry fields we use; dispatch on the sentence
+            # tag so other types (GSV, GSA, VTG, ...) skip the parser.
+            tag = stripped_sentence[3:6]
+            if tag not in ("GGA", "RMC"):
+                continue
             try:
                 msg = pynmea2.parse(stripped_sentence)
-                if isinstance(msg, pynmea2.types.talker.GGA):
+                if tag == "GGA":
                     new_gps_data.altitude = float(msg.altitude) if msg.altitude else None
-                elif isinstance(msg, pynmea2.types.talker.RMC):
+                else:
                     new_gps_data.latitude = msg.latitude if msg.latitude else None
                     new_gps_data.longitude = msg.longitude if msg.longitude else None
                     new_gps_data.heading = float(msg.true_course) if msg.true_course else None
@@ -96,7 +147,12 @@ class GPSModule:
     def _update_gps_data(self, new_gps_data: GPSData) -> None:
         """Update the current GPS data and state."""
         if new_gps_data.latitude is not None and new_gps_data.longitude is not None:
-            easting, northing = self._latlon_to_utm(new_gps_data.latitude, new_gps_data.longitude)
+            cached = self._last_transform
+            if cached is not None and cached[0] == new_gps_data.latitude and cached[1] == new_gps_data.longitude:
+                easting, northing = cached[2], cached[3]
+            else:
+                easting, northing = self._latlon_to_utm(new_gps_data.latitude, new_gps_data.longitude)
+                self._last_transform = (new_gps_data.latitude, new_gps_data.longitude, easting, northing)
             new_gps_data.easting = easting
             new_gps_data.northing = northing
             new_gps_data.epsg_code = self._epsg_code
@@ -107,28 +163,47 @@ class GPSModule:
         # Only update to RUNNING if we have valid coordinates and in INITIALIZING state
         if new_gps_data.latitude is not None and new_gps_data.longitude is not None:
             current_state = self._state_manager.get_gps_state()
-            if current_state == GPSState.INITIALIZING.value:
+            if current_state == _STATE_INITIALIZING:
                 self._state_manager.set_gps_state(GPSState.RUNNING)
 
     def run(self) -> None:
         """Continuously read and process GPS data."""
         # Set to INITIALIZING when starting to wait for lock
         self._state_manager.set_gps_state(GPSState.INITIALIZING)
-        self._running.set()
+        self._stop_event.clear()
+
+        # Interface reads block on the serial/I2C layer; run them on their
+        # own thread so parsing overlaps with I/O instead of serializing
+        # behind it.
+        reader = threading.Thread(target=self._reader_loop, name="gps-reader", daemon=True)
+        reader.start()
+
+        while not self._stop_event.is_set():
+            try:
+                chunk = self._read_queue.get(timeout=self.GPS_RETRY_INTERVAL)
+            except queue.Empty:
+                self._check_data_timeout()
+                continue
+            self._buffer.extend(chunk)
+            self._process_buffer()
+
+        reader.join()
 
-        while self._running.is_set():
+    def _reader_loop(self) -> None:
+        """Read chunks from the GPS interface and hand them to the parse loop."""
+        while not self._stop_event.is_set():
             data = self._read_gps_data(32)
             if data:
                 try:
-                    incoming_data = "".join(chr(c) for c in data)
-                    self._buffer += incoming_data
-                    self._process_buffer()
-                except UnicodeDecodeError:
-                    logger.warning("Received non-UTF8 data from GPS interface")
+                    self._read_queue.put_nowait(data)
+                except queue.Full:
+                    logger.warning("GPS read queue full; dropping chunk")
             else:
-                time.sleep(self.GPS_RETRY_INTERVAL)
+                # Interruptible retry wait: stop() wakes the loop immediately
+                # instead of stalling shutdown for up to the full interval.
+                self._stop_event.wait(self.GPS_RETRY_INTERVAL)
 
     def stop(self) -> None:
         """Stop the GPS module's data acquisition loop."""
-        self._running.clear()
+        self._stop_event.set()
         self._state_manager.set_gps_state(GPSState.IDLE)
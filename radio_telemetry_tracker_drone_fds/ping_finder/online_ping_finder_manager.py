@@ -33,7 +33,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Import at the end to avoid circular imports
-from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import PingFinderModule  # noqa: E402
+from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import (  # noqa: E402
+    VALID_SDR_TYPES,
+    PingFinderModule,
+)
 
 
 class OnlinePingFinderManager:
@@ -60,6 +63,15 @@ class OnlinePingFinderManager:
         self._hardware_config = hardware_config
         self._ping_finder_module: PingFinderModule | None = None
         self._pending_actions: dict[int, tuple[str, dict]] = {}
+        # Reusable message object; send_gps_data serializes synchronously, so
+        # updating fields in place avoids a fresh allocation every second.
+        self._gps_msg = GPSData(
+            easting=None,
+            northing=None,
+            altitude=None,
+            heading=None,
+            epsg_code=None,
+        )
 
         # Register handlers and start DroneComms
         self._register_handlers()
@@ -96,13 +108,13 @@ class OnlinePingFinderManager:
         while True:
             if self._state_manager.get_gps_state() == "Running":
                 gps_data = self._state_manager.get_current_gps_data()
-                self._drone_comms.send_gps_data(GPSData(
-                    easting=gps_data.easting,
-                    northing=gps_data.northing,
-                    altitude=gps_data.altitude,
-                    heading=gps_data.heading,
-                    epsg_code=gps_data.epsg_code,
-                ))
+                msg = self._gps_msg
+                msg.easting = gps_data.easting
+                msg.northing = gps_data.northing
+                msg.altitude = gps_data.altitude
+                msg.heading = gps_data.heading
+                msg.epsg_code = gps_data.epsg_code
+                self._drone_comms.send_gps_data(msg)
             time.sleep(1)  # Send GPS data every second when running
 
     def _handle_ack_success(self, packet_id: int) -> None:
@@ -216,14 +228,35 @@ class OnlinePingFinderManager:
                 "target_frequencies": list(data.target_frequencies),
                 "output_dir": str(self._get_output_directory()),
             }
-
-            # Send the config response and store pending action
-            packet_id, _, _ = self._drone_comms.send_config_response(ConfigResponseData(success=True))
-            self._pending_actions[packet_id] = ("config", config_dict)
-
+        except FileNotFoundError:
+            # Output storage is unavailable; reject immediately instead of
+            # deferring the failure to the acknowledgment round-trip.
+            logger.exception("Rejecting config request: output storage unavailable")
+            self._drone_comms.send_config_response(ConfigResponseData(success=False))
+            return
         except Exception:
             logger.exception("Failed to prepare config")
             self._drone_comms.send_error(ErrorData())
+            return
+
+        if not self._validate_config(config_dict):
+            self._drone_comms.send_config_response(ConfigResponseData(success=False))
+            return
+
+        # Send the config response and store pending action
+        packet_id, _, _ = self._drone_comms.send_config_response(ConfigResponseData(success=True))
+        self._pending_actions[packet_id] = ("config", config_dict)
+
+    def _validate_config(self, config_dict: dict) -> bool:
+        """Run cheap validity checks before acknowledging a config request."""
+        sdr_type = self._hardware_config.SDR_TYPE
+        if sdr_type is None or sdr_type.upper() not in VALID_SDR_TYPES:
+            logger.error("Rejecting config request: invalid SDR_TYPE %s", sdr_type)
+            return False
+        if not config_dict["target_frequencies"]:
+            logger.error("Rejecting config request: no target frequencies")
+            return False
+        return True
 
     def _get_output_directory(self) -> str:
         """Get output directory based on hardware configuration."""
@@ -5,7 +5,9 @@ from __future__ import annotations
 import csv
 import datetime as dt
 import logging
+import queue
 import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,11 +20,47 @@ from radio_telemetry_tracker_drone_fds.state.state_manager import PingFinderStat
 if TYPE_CHECKING:
     from radio_telemetry_tracker_drone_fds.config import PingFinderConfig
     from radio_telemetry_tracker_drone_fds.gps.gps_module import GPSModule
+    from radio_telemetry_tracker_drone_fds.state import GPSData
 
 from radio_telemetry_tracker_drone_fds.utils.logging_helper import log_estimation, log_ping
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on CSV rows coalesced into a single writerows call
+_CSV_BATCH_MAX_ROWS = 64
+
+# Supported SDR types, mapped to their rct_dsp2 identifiers
+_SDR_TYPE_MAP = {
+    "USRP": SDR_TYPE_USRP,
+    "AIRSPY": SDR_TYPE_AIRSPY,
+    "HACKRF": SDR_TYPE_HACKRF,
+    "GENERATOR": SDR_TYPE_GENERATOR,
+}
+
+# Public view of the supported type names, for validation elsewhere
+VALID_SDR_TYPES = frozenset(_SDR_TYPE_MAP)
+
+# Fixed header rows, preformatted so startup skips the csv.writer machinery
+_PING_CSV_HEADER = "Run,Timestamp,Frequency,Amplitude,Easting,Northing,Altitude,Heading,EPSG Code\r\n"
+_ESTIMATION_CSV_HEADER = "Run,Timestamp,Frequency,Easting,Northing,EPSG Code\r\n"
+
+# PingFinderConfig attributes that are applied directly onto the PingFinder
+# instance; output_dir is consumed by the CSV logger instead.
+_PING_FINDER_CONFIG_ATTRS = frozenset(
+    {
+        "gain",
+        "sampling_rate",
+        "center_frequency",
+        "run_num",
+        "enable_test_data",
+        "ping_width_ms",
+        "ping_min_snr",
+        "ping_max_len_mult",
+        "ping_min_len_mult",
+        "target_frequencies",
+    },
+)
+
 
 class PingFinderModule:
     """Handles ping finding operations using SDR."""
@@ -44,34 +82,52 @@ class PingFinderModule:
         self._drone_comms = drone_comms
         self._thread: threading.Thread | None = None
 
+        # Reusable message objects for the callback path; the comms layer
+        # serializes synchronously, so in-place field updates avoid two
+        # allocations per detected ping.
+        self._ping_msg = PingData(
+            frequency=0,
+            amplitude=0.0,
+            easting=None,
+            northing=None,
+            altitude=None,
+            epsg_code=None,
+        )
+        self._loc_est_msg = LocEstData(
+            frequency=0,
+            easting=0.0,
+            northing=0.0,
+            epsg_code=None,
+        )
+
         # Initialize and configure
         self._initialize_csv_log(config)
+        self._start_csv_writer_thread()
         self._configure_ping_finder(config, sdr_type)
         self._location_estimator = LocationEstimator(self._get_current_location)
+        # Latest estimate per frequency, updated on each callback so
+        # get_final_estimations() does not have to re-run the estimator.
+        self._latest_estimates: dict[int, tuple[float, float, float]] = {}
+        # Last (timestamp, record) GPS lookup; the callback and the location
+        # estimator resolve the same ping timestamp back to back.
+        self._last_gps_lookup: tuple[float, GPSData] | None = None
 
         # Set to IDLE after initialization
         self._state_manager.set_ping_finder_state(PingFinderState.IDLE)
 
     def _configure_ping_finder(self, config: PingFinderConfig, sdr_type: str) -> None:
         """Apply configuration to PingFinder instance."""
-        valid_sdr_types = {
-            "USRP": SDR_TYPE_USRP,
-            "AIRSPY": SDR_TYPE_AIRSPY,
-            "HACKRF": SDR_TYPE_HACKRF,
-            "GENERATOR": SDR_TYPE_GENERATOR,
-        }
-
-        sdr_type = sdr_type.upper()
-        if sdr_type not in valid_sdr_types:
-            msg = f"Invalid SDR_TYPE: {sdr_type}. Valid options: {', '.join(valid_sdr_types.keys())}"
+        sdr_id = _SDR_TYPE_MAP.get(sdr_type.upper())
+        if sdr_id is None:
+            msg = f"Invalid SDR_TYPE: {sdr_type.upper()}. Valid options: {', '.join(_SDR_TYPE_MAP.keys())}"
             raise ValueError(msg)
 
         # Set SDR type
-        self._ping_finder.sdr_type = valid_sdr_types[sdr_type]
+        self._ping_finder.sdr_type = sdr_id
 
         # Apply other configurations
         for key, value in config.__dict__.items():
-            if hasattr(self._ping_finder, key):
+            if key in _PING_FINDER_CONFIG_ATTRS:
                 setattr(self._ping_finder, key, value)
 
         # Register callback
@@ -85,84 +141,128 @@ class PingFinderModule:
         self._csv_ping_filename = output_dir / f"ping_log_{timestamp}_run{self._run_num}.csv"
         self._csv_estimation_filename = output_dir / f"location_estimation_log_{timestamp}_run{self._run_num}.csv"
 
-        with self._csv_ping_filename.open("w", newline="") as csv_file:
-            csv_writer = csv.writer(csv_file)
-            csv_writer.writerow(
-                [
-                    "Run",
-                    "Timestamp",
-                    "Frequency",
-                    "Amplitude",
-                    "Easting",
-                    "Northing",
-                    "Altitude",
-                    "Heading",
-                    "EPSG Code",
-                ],
-            )
+        # Keep the files open for the lifetime of the run; reopening per row
+        # made every callback pay open/close syscall overhead.
+        self._csv_lock = threading.Lock()
+        self._csv_ping_file = self._csv_ping_filename.open("w", newline="")
+        self._csv_ping_writer = csv.writer(self._csv_ping_file)
+        self._csv_ping_file.write(_PING_CSV_HEADER)
+
+        self._csv_estimation_file = self._csv_estimation_filename.open("w", newline="")
+        self._csv_estimation_writer = csv.writer(self._csv_estimation_file)
+        self._csv_estimation_file.write(_ESTIMATION_CSV_HEADER)
+
+    def _start_csv_writer_thread(self) -> None:
+        """Start the background thread that drains queued CSV rows."""
+        self._csv_queue: queue.Queue[tuple[str, list]] = queue.Queue()
+        self._csv_writer_thread = threading.Thread(target=self._drain_csv_queue, daemon=True)
+        self._csv_writer_thread.start()
+
+    def _drain_csv_queue(self) -> None:
+        """Write queued CSV rows from a dedicated thread, coalescing bursts."""
+        while True:
+            # Block for the first row, then grab whatever else is pending so a
+            # burst of pings becomes one writerows call instead of N writerow
+            # calls.
+            batch = [self._csv_queue.get()]
+            try:
+                while len(batch) < _CSV_BATCH_MAX_ROWS:
+                    batch.append(self._csv_queue.get_nowait())
+            except queue.Empty:
+                pass
 
-        with self._csv_estimation_filename.open("w", newline="") as csv_file:
-            csv_writer = csv.writer(csv_file)
-            csv_writer.writerow(
-                [
-                    "Run",
-                    "Timestamp",
-                    "Frequency",
-                    "Easting",
-                    "Northing",
-                    "EPSG Code",
-                ],
-            )
+            ping_rows = [row for kind, row in batch if kind == "ping"]
+            estimation_rows = [row for kind, row in batch if kind == "estimation"]
+            try:
+                with self._csv_lock:
+                    if ping_rows:
+                        self._csv_ping_writer.writerows(ping_rows)
+                    if estimation_rows:
+                        self._csv_estimation_writer.writerows(estimation_rows)
+            except Exception:
+                logger.exception("Failed to write CSV rows.")
+            finally:
+                for _ in batch:
+                    self._csv_queue.task_done()
 
     def _log_ping_to_csv(self, data: tuple) -> None:
-        """Log ping data to CSV."""
-        try:
-            with self._csv_ping_filename.open("a", newline="") as csv_file:
-                csv_writer = csv.writer(csv_file)
-                csv_writer.writerow([self._run_num, *list(data)])
-        except Exception:
-            logger.exception("Failed to write ping data to CSV.")
+        """Queue ping data for CSV logging."""
+        self._csv_queue.put(("ping", [self._run_num, *data]))
 
     def _log_estimation_to_csv(self, data: tuple) -> None:
-        """Log location estimation to CSV."""
+        """Queue location estimation data for CSV logging."""
+        self._csv_queue.put(("estimation", [self._run_num, *data]))
+
+    def _flush_csv_log(self) -> None:
+        """Flush buffered CSV rows to disk."""
+        try:
+            with self._csv_lock:
+                self._csv_ping_file.flush()
+                self._csv_estimation_file.flush()
+        except OSError:
+            logger.exception("Failed to flush CSV log files.")
+
+    def _close_csv_log(self) -> None:
+        """Close the CSV log files."""
         try:
-            with self._csv_estimation_filename.open("a", newline="") as csv_file:
-                csv_writer = csv.writer(csv_file)
-                csv_writer.writerow([self._run_num, *list(data)])
-        except Exception:
-            logger.exception("Failed to write estimation data to CSV.")
+            with self._csv_lock:
+                self._csv_ping_file.close()
+                self._csv_estimation_file.close()
+        except OSError:
+            logger.exception("Failed to close CSV log files.")
 
     def _callback(self, now: dt.datetime, amplitude: float, frequency: int) -> None:
         """Callback invoked by PingFinder when a ping is detected."""
         logger.debug("PingFinderModule._callback called")
 
+        # Bind per-ping invariants to locals once
+        drone_comms = self._drone_comms
+        run_num = self._run_num
+
         # Use the ping's timestamp to get the closest GPS data
         target_timestamp = now.timestamp()
-        gps_data = self._state_manager.get_gps_data_closest_to(target_timestamp)
+        gps_data = self._gps_at(target_timestamp)
         if gps_data is None:
             logger.error("No GPS data available for the ping at timestamp %s", now.isoformat())
             return
 
+        # The state manager pre-formats the timestamp on ingest; fall back to
+        # formatting here only if the record predates that path.
+        gps_ts_iso = gps_data.iso_timestamp
+        if gps_ts_iso is None:
+            gps_ts_iso = dt.datetime.fromtimestamp(gps_data.timestamp, tz=dt.timezone.utc).isoformat()
+
         # Log ping data using the logging helper
         log_ping(
-            self._run_num,
-            dt.datetime.fromtimestamp(gps_data.timestamp, tz=dt.timezone.utc).isoformat(),
+            run_num,
+            gps_ts_iso,
             frequency,
             amplitude,
             gps_data,
         )
+        self._log_ping_to_csv(
+            (
+                gps_ts_iso,
+                frequency,
+                amplitude,
+                gps_data.easting,
+                gps_data.northing,
+                gps_data.altitude,
+                gps_data.heading,
+                gps_data.epsg_code,
+            ),
+        )
 
         # Send ping data if in ONLINE mode
-        if self._drone_comms is not None:
-            ping_data = PingData(
-                frequency=frequency,
-                amplitude=amplitude,
-                easting=gps_data.easting,
-                northing=gps_data.northing,
-                altitude=gps_data.altitude,
-                epsg_code=gps_data.epsg_code,
-            )
-            self._drone_comms.send_ping_data(ping_data)
+        if drone_comms is not None:
+            ping_data = self._ping_msg
+            ping_data.frequency = frequency
+            ping_data.amplitude = amplitude
+            ping_data.easting = gps_data.easting
+            ping_data.northing = gps_data.northing
+            ping_data.altitude = gps_data.altitude
+            ping_data.epsg_code = gps_data.epsg_code
+            drone_comms.send_ping_data(ping_data)
 
         # Add ping to location estimator
         self._location_estimator.add_ping(now, amplitude, frequency)
@@ -170,29 +270,39 @@ class PingFinderModule:
 
         # Use logging helper to log estimation
         if estimate is not None:
+            self._latest_estimates[frequency] = estimate
             log_estimation(
-                self._run_num,
-                dt.datetime.fromtimestamp(gps_data.timestamp, tz=dt.timezone.utc).isoformat(),
+                run_num,
+                gps_ts_iso,
                 frequency,
                 estimate,
                 gps_data,
             )
+            self._log_estimation_to_csv(
+                (
+                    gps_ts_iso,
+                    frequency,
+                    estimate[0],
+                    estimate[1],
+                    gps_data.epsg_code,
+                ),
+            )
 
             # Send location estimation if in ONLINE mode
-            if self._drone_comms is not None:
-                loc_est_data = LocEstData(
-                    frequency=frequency,
-                    easting=estimate[0],
-                    northing=estimate[1],
-                    epsg_code=gps_data.epsg_code,
-                )
-                self._drone_comms.send_loc_est_data(loc_est_data)
-
-            logger.info("=" * 60)
-            logger.info("Estimated Location:")
-            logger.info("  Easting:  %.2f", estimate[0])
-            logger.info("  Northing: %.2f", estimate[1])
-            logger.info("=" * 60)
+            if drone_comms is not None:
+                loc_est_data = self._loc_est_msg
+                loc_est_data.frequency = frequency
+                loc_est_data.easting = estimate[0]
+                loc_est_data.northing = estimate[1]
+                loc_est_data.epsg_code = gps_data.epsg_code
+                drone_comms.send_loc_est_data(loc_est_data)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 60)
+                logger.info("Estimated Location:")
+                logger.info("  Easting:  %.2f", estimate[0])
+                logger.info("  Northing: %.2f", estimate[1])
+                logger.info("=" * 60)
 
     def start(self) -> None:
         """Start the ping finding operation in a separate thread."""
@@ -219,13 +329,16 @@ class PingFinderModule:
             self._ping_finder.stop()
             if self._thread:
                 self._thread.join()
+            self._csv_queue.join()  # Let the writer thread drain pending rows
+            self._flush_csv_log()
             self._state_manager.set_ping_finder_state(PingFinderState.IDLE)
 
     def _run(self) -> None:
         """Ping finding operation loop."""
         try:
-            while not self._stop_event.is_set():
-                self._stop_event.wait(0.1)
+            # Block until stop() is requested; the PingFinder C thread runs
+            # independently, so no periodic Python-side work is needed here.
+            self._stop_event.wait()
         except (OSError, RuntimeError):
             logger.exception("PingFinder error")
             self._state_manager.set_ping_finder_state(PingFinderState.ERROR)
@@ -235,10 +348,23 @@ class PingFinderModule:
 
     def _get_current_location(self, timestamp: dt.datetime | None = None) -> tuple[float, float, float]:
         """Get current GPS location in UTM coordinates based on the closest GPS data to the given timestamp."""
-        if timestamp is None:
-            timestamp = dt.datetime.now(tz=dt.timezone.utc)
-
-        gps_data = self._state_manager.get_gps_data_closest_to(timestamp.timestamp())
+        # Work in epoch seconds internally; time.time() avoids building a
+        # datetime just to convert it straight back to a float.
+        return self._get_current_location_ts(time.time() if timestamp is None else timestamp.timestamp())
+
+    def _gps_at(self, timestamp: float) -> GPSData | None:
+        """Look up the GPS data closest to a timestamp, reusing the last lookup."""
+        cached = self._last_gps_lookup
+        if cached is not None and cached[0] == timestamp:
+            return cached[1]
+        gps_data = self._state_manager.get_gps_data_closest_to(timestamp)
+        if gps_data is not None:
+            self._last_gps_lookup = (timestamp, gps_data)
+        return gps_data
+
+    def _get_current_location_ts(self, timestamp: float) -> tuple[float, float, float]:
+        """Get the GPS location in UTM coordinates closest to an epoch timestamp."""
+        gps_data = self._gps_at(timestamp)
         if gps_data is None or gps_data.easting is None or gps_data.northing is None or gps_data.altitude is None:
             msg = "GPS data not available for location estimation"
             logger.error(msg)
@@ -249,7 +375,9 @@ class PingFinderModule:
         """Return final estimations for all frequencies."""
         final_estimations = []
         for frequency in self._location_estimator.get_frequencies():
-            estimate = self._location_estimator.do_estimate(frequency)
+            estimate = self._latest_estimates.get(frequency)
+            if estimate is None:
+                estimate = self._location_estimator.do_estimate(frequency)
             if estimate is not None:
                 final_estimations.append((frequency, *estimate))
         return final_estimations
@@ -271,9 +399,12 @@ class PingFinderModule:
         self._run_num = config.run_num
 
         # Reinitialize with new config
+        self._csv_queue.join()  # Drain rows destined for the old files
+        self._close_csv_log()
         self._initialize_csv_log(config)
         self._configure_ping_finder(config, sdr_type)
         self._location_estimator = LocationEstimator(self._get_current_location)
+        self._latest_estimates.clear()
 
         # Set to IDLE after reconfiguration
         self._state_manager.set_ping_finder_state(PingFinderState.IDLE)
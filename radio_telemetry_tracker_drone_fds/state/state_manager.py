@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import array
 import bisect
+import datetime as dt
 import logging
 import time
 from dataclasses import dataclass, field
@@ -12,6 +14,9 @@ from threading import Lock
 logger = logging.getLogger(__name__)
 
 MAX_HISTORY = 1000
+# Trim the history in blocks so the O(n) element shift is paid once per
+# _TRIM_CHUNK updates instead of on every GPS sample.
+_TRIM_CHUNK = 100
 
 # GPS State Definitions
 class GPSState(Enum):
@@ -31,8 +36,14 @@ class PingFinderState(Enum):
     RUNNING = "Running"
     ERROR = "Error"
 
+
+# Enum .value goes through a descriptor on every access; the state getters
+# are polled continuously, so resolve the strings once up front.
+_GPS_STATE_VALUES = {state: state.value for state in GPSState}
+_PING_FINDER_STATE_VALUES = {state: state.value for state in PingFinderState}
+
 # GPS Data
-@dataclass
+@dataclass(slots=True)
 class GPSData:
     """Represents GPS coordinate data with a timestamp."""
     timestamp: float = field(default_factory=time.time)
@@ -43,6 +54,10 @@ class GPSData:
     easting: float | None = None
     northing: float | None = None
     epsg_code: int | None = None
+    # ISO-formatted timestamp, filled in on ingest; GPS samples arrive at a
+    # few Hz while pings can burst, so formatting once here is cheaper than
+    # formatting per ping in the consumers.
+    iso_timestamp: str | None = None
 
 # Centralized StateManager
 class StateManager:
@@ -53,7 +68,12 @@ class StateManager:
         self._lock = Lock()
         self._gps_state = GPSState.UNCREATED
         self._ping_finder_state = PingFinderState.UNCREATED
-        self._gps_data_history: list[tuple[float, GPSData]] = []
+        # History is kept as parallel arrays (structure-of-arrays): a sorted
+        # timestamp array for binary search plus the matching GPSData records.
+        # array('d') stores the timestamps as packed C doubles rather than
+        # boxed floats, so the history costs 8 bytes per entry.
+        self._gps_timestamps = array.array("d")
+        self._gps_history: list[GPSData] = []
         self._current_gps_data: GPSData = GPSData()
 
     def set_gps_state(self, state: GPSState) -> None:
@@ -66,42 +86,58 @@ class StateManager:
 
     def update_gps_data(self, data: GPSData) -> None:
         """Update the current GPS data and maintain history."""
+        if data.iso_timestamp is None:
+            data.iso_timestamp = dt.datetime.fromtimestamp(data.timestamp, tz=dt.timezone.utc).isoformat()
         with self._lock:
-            bisect.insort(self._gps_data_history, (data.timestamp, data))
+            if not self._gps_timestamps or data.timestamp >= self._gps_timestamps[-1]:
+                # GPS samples arrive in time order, so the common case is a
+                # plain O(1) append.
+                self._gps_timestamps.append(data.timestamp)
+                self._gps_history.append(data)
+            else:
+                # Rare out-of-order sample: fall back to a sorted insert
+                index = bisect.bisect(self._gps_timestamps, data.timestamp)
+                self._gps_timestamps.insert(index, data.timestamp)
+                self._gps_history.insert(index, data)
             self._current_gps_data = data
-            if len(self._gps_data_history) > MAX_HISTORY:
-                self._gps_data_history.pop(0)  # Remove the oldest entry
+            if len(self._gps_timestamps) >= MAX_HISTORY + _TRIM_CHUNK:
+                # Drop the oldest block of entries
+                del self._gps_timestamps[:_TRIM_CHUNK]
+                del self._gps_history[:_TRIM_CHUNK]
 
     def get_gps_state(self) -> str:
         """Retrieve the current GPS state."""
-        with self._lock:
-            return self._gps_state.value
+        # Reading the reference is atomic under the GIL; only writers lock.
+        return _GPS_STATE_VALUES[self._gps_state]
 
     def get_gps_data_closest_to(self, timestamp: float) -> GPSData | None:
         """Retrieve the GPS data closest to the given timestamp."""
         with self._lock:
-            if not self._gps_data_history:
+            if not self._gps_timestamps:
                 return None
 
-            timestamps = [entry[0] for entry in self._gps_data_history]
-            index = bisect.bisect_left(timestamps, timestamp)
+            # Pings are correlated shortly after they arrive, so the common
+            # case is a request newer than the newest sample: answer it
+            # without searching.
+            if timestamp >= self._gps_timestamps[-1]:
+                return self._gps_history[-1]
+            if timestamp <= self._gps_timestamps[0]:
+                return self._gps_history[0]
 
-            if index == 0:
-                return self._gps_data_history[0][1]
-            if index == len(self._gps_data_history):
-                return self._gps_data_history[-1][1]
+            index = bisect.bisect_left(self._gps_timestamps, timestamp)
 
-            before = self._gps_data_history[index - 1]
-            after = self._gps_data_history[index]
+            before = self._gps_timestamps[index - 1]
+            after = self._gps_timestamps[index]
 
-            if abs(before[0] - timestamp) <= abs(after[0] - timestamp):
-                return before[1]
-            return after[1]
+            if abs(before - timestamp) <= abs(after - timestamp):
+                return self._gps_history[index - 1]
+            return self._gps_history[index]
 
     def get_current_gps_data(self) -> GPSData:
         """Retrieve the current GPS data."""
-        with self._lock:
-            return self._current_gps_data
+        # The record reference is only ever replaced, never mutated after
+        # ingest, so readers can take it without the lock.
+        return self._current_gps_data
 
     def set_ping_finder_state(self, state: PingFinderState) -> None:
         """Set the PingFinder state."""
@@ -113,5 +149,4 @@ class StateManager:
 
     def get_ping_finder_state(self) -> str:
         """Retrieve the current PingFinder state."""
-        with self._lock:
-            return self._ping_finder_state.value
+        return _PING_FINDER_STATE_VALUES[self._ping_finder_state]
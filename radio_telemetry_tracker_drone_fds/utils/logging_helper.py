@@ -11,6 +11,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _or_na(value: float | None, spec: str = "") -> str:
+    """Format a value, falling back to "N/A" when it is None."""
+    return "N/A" if value is None else format(value, spec)
+
+
 def log_ping(
     run_num: int,
     now: str,
@@ -19,6 +24,8 @@ def log_ping(
     gps_data: GPSData,
 ) -> None:
     """Log ping data in a structured manner."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "Ping Detected - Run: %d, Timestamp: %s, Frequency: %d Hz, Amplitude: %.2f, "
         "Easting: %s, Northing: %s, Altitude: %s, Heading: %s, EPSG Code: %s",
@@ -26,11 +33,11 @@ def log_ping(
         now,
         frequency,
         amplitude,
-        gps_data.easting if gps_data.easting is not None else "N/A",
-        gps_data.northing if gps_data.northing is not None else "N/A",
-        gps_data.altitude if gps_data.altitude is not None else "N/A",
-        gps_data.heading if gps_data.heading is not None else "N/A",
-        gps_data.epsg_code if gps_data.epsg_code is not None else "N/A",
+        _or_na(gps_data.easting),
+        _or_na(gps_data.northing),
+        _or_na(gps_data.altitude),
+        _or_na(gps_data.heading),
+        _or_na(gps_data.epsg_code),
     )
 
 
@@ -42,6 +49,8 @@ def log_estimation(
     gps_data: GPSData,
 ) -> None:
     """Log location estimation data."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if estimate:
         logger.info(
             "Estimation - Run: %d, Timestamp: %s, Frequency: %d Hz, "
@@ -51,5 +60,5 @@ def log_estimation(
             frequency,
             estimate[0],
             estimate[1],
-            gps_data.epsg_code if gps_data.epsg_code is not None else "N/A",
+            _or_na(gps_data.epsg_code),
         )
@@ -1,19 +1,45 @@
 """Utility module for logging setup."""
 
+from __future__ import annotations
+
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+# Keeps the QueueListener alive for the life of the process.
+_queue_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging() -> None:
     """Configure basic logging settings with console handler."""
+    # None of the log formats reference thread/process fields or source
+    # locations, so skip the per-record introspection that collects them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None  # noqa: SLF001
+
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
+    # An explicit datefmt keeps asctime to a single strftime call instead of
+    # the default's strftime-plus-millisecond formatting pass.
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Route records through a queue so the GPS and ping threads only pay an
+    # enqueue; formatting and the stdout write happen on the listener thread.
+    global _queue_listener  # noqa: PLW0603
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
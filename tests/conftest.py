@@ -1,11 +1,76 @@
 """Test fixtures for the radio telemetry tracker drone FDS package."""
 
-from typing import Any
+from typing import Any, cast
+from unittest.mock import MagicMock
 
 import pytest
 
 from radio_telemetry_tracker_drone_fds.state import StateManager
 
+# Send methods whose mocks return (packet_id, need_ack, timestamp); packet
+# ids are assigned from the tuple order.
+_RESPONSE_METHODS = (
+    "send_sync_response",
+    "send_start_response",
+    "send_stop_response",
+    "send_config_response",
+    "send_error",
+)
+
+
+class PingFinderStub:
+    """Minimal stand-in for rct_dsp2.PingFinder.
+
+    Carries only the attributes configure() sets and the methods the
+    modules under test call; mocked methods keep call assertions working.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all configurable attributes and mocked methods."""
+        self.sdr_type = None
+        self.gain = None
+        self.sampling_rate = None
+        self.center_frequency = None
+        self.run_num = None
+        self.enable_test_data = None
+        self.ping_width_ms = None
+        self.ping_min_snr = None
+        self.ping_max_len_mult = None
+        self.ping_min_len_mult = None
+        self.target_frequencies = None
+        self.start = MagicMock(return_value=None)
+        self.stop = MagicMock(return_value=None)
+        self.register_callback = MagicMock(return_value=None)
+
+
+@pytest.fixture
+def mock_ping_finder() -> PingFinderStub:
+    """Provide a stubbed PingFinder instance."""
+    return PingFinderStub()
+
+
+@pytest.fixture
+def mock_drone_comms() -> MagicMock:
+    """Provide a mocked DroneComms with send-method return tuples."""
+    # Imported lazily so collecting tests that never use this fixture does
+    # not load the comms package.
+    from radio_telemetry_tracker_drone_comms_package import DroneComms
+
+    mock = cast(MagicMock, MagicMock(spec=DroneComms))
+    for packet_id, name in enumerate(_RESPONSE_METHODS, start=1):
+        getattr(mock, name).return_value = (packet_id, False, 0)
+    return mock
+
+
+@pytest.fixture
+def mock_gps_module() -> MagicMock:
+    """Provide a GPSModule mock narrowed to the real interface."""
+    # Imported lazily so collecting tests that never use this fixture does
+    # not load the GPS stack.
+    from radio_telemetry_tracker_drone_fds.gps.gps_module import GPSModule
+
+    return cast(MagicMock, MagicMock(spec=GPSModule))
+
 
 @pytest.fixture
 def hardware_config_data() -> dict[str, Any]:
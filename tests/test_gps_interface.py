@@ -17,7 +17,7 @@ def test_simulated_gps_interface() -> None:
     interface = SimulatedGPSInterface(simulation_speed=1.0)
     data = interface.read_gps_data()
     assert data is not None  # noqa: S101
-    assert isinstance(data, list)  # noqa: S101
+    assert isinstance(data, bytes)  # noqa: S101
     assert len(data) > 0  # noqa: S101
 
 
@@ -25,7 +25,7 @@ def test_simulated_gps_interface_data_format() -> None:
     """Test that simulated GPS data follows NMEA format specifications."""
     interface = SimulatedGPSInterface(simulation_speed=1.0)
     data = interface.read_gps_data()
-    nmea_str = "".join(chr(c) for c in data)
+    nmea_str = data.decode("ascii")
     sentences = nmea_str.strip().split("\r\n")
     assert len(sentences) >= MIN_NMEA_SENTENCES  # noqa: S101
     for sentence in sentences:
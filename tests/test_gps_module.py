@@ -26,7 +26,7 @@ def test_gps_module_process_buffer() -> None:
     state_manager = StateManager()
     gps_module = GPSModule(interface, epsg_code=TEST_EPSG_CODE, state_manager=state_manager)
     # Simulate receiving NMEA sentences
-    gps_module._buffer = TEST_NMEA  # noqa: SLF001
+    gps_module._buffer = bytearray(TEST_NMEA.encode("ascii"))  # noqa: SLF001
     gps_module._process_buffer()  # noqa: SLF001
     gps_data = state_manager.get_current_gps_data()
     assert gps_data.altitude == TEST_ALTITUDE  # noqa: S101
@@ -1,17 +1,23 @@
 """Tests for PingFinderModule functionality."""
+from __future__ import annotations
+
+import dataclasses
 import datetime as dt
-from typing import cast
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
-from radio_telemetry_tracker_drone_comms_package import DroneComms, PingData
-from rct_dsp2 import SDR_TYPE_GENERATOR, PingFinder
 
 from radio_telemetry_tracker_drone_fds.config import PingFinderConfig
-from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import PingFinderModule
 from radio_telemetry_tracker_drone_fds.state import GPSData, StateManager
 from radio_telemetry_tracker_drone_fds.state.state_manager import PingFinderState
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import PingFinderModule
+    from tests.conftest import PingFinderStub
+
 # Constants for test values
 TEST_GAIN = 50.0
 TEST_GAIN_NEW = 60.0
@@ -23,189 +29,167 @@ TEST_NORTHING = 3762151
 TEST_ALTITUDE = 10
 TEST_AMPLITUDE = 10.0
 
+# Reference time taken once at import; the callback tests only need a
+# consistent timestamp, not the actual current time.
+NOW_DT = dt.datetime.now(dt.timezone.utc)
 
-@pytest.fixture
-def ping_finder_config_data() -> dict:
-    """Fixture for PingFinderConfig test data."""
-    return {
-        "gain": TEST_GAIN,
-        "sampling_rate": TEST_SAMPLING_RATE,
-        "center_frequency": TEST_CENTER_FREQ,
-        "run_num": 1,
-        "enable_test_data": True,
-        "ping_width_ms": 20,
-        "ping_min_snr": 10,
-        "ping_max_len_mult": 1.5,
-        "ping_min_len_mult": 0.5,
-        "target_frequencies": [TEST_CENTER_FREQ],
-        "output_dir": "test_output",
-    }
 
+# PingFinderConfig test data; parsed once per session by the base fixture.
+_CONFIG_DICT = {
+    "gain": TEST_GAIN,
+    "sampling_rate": TEST_SAMPLING_RATE,
+    "center_frequency": TEST_CENTER_FREQ,
+    "run_num": 1,
+    "enable_test_data": True,
+    "ping_width_ms": 20,
+    "ping_min_snr": 10,
+    "ping_max_len_mult": 1.5,
+    "ping_min_len_mult": 0.5,
+    "target_frequencies": [TEST_CENTER_FREQ],
+    "output_dir": "test_output",
+}
 
-@pytest.fixture
-def ping_finder_config(ping_finder_config_data: dict) -> PingFinderConfig:
-    """Fixture for PingFinderConfig."""
-    return PingFinderConfig.from_dict(ping_finder_config_data)
+
+@pytest.fixture(scope="session")
+def ping_finder_config() -> PingFinderConfig:
+    """Parse the shared PingFinderConfig once for the whole session.
+
+    The config is consumed read-only; tests that need variants build
+    them with dataclasses.replace rather than mutating this instance.
+    """
+    return PingFinderConfig.from_dict(_CONFIG_DICT)
+
+
+@pytest.fixture(scope="session")
+def sdr_type_generator() -> int:
+    """Import the SDR_TYPE_GENERATOR constant once per session."""
+    from rct_dsp2 import SDR_TYPE_GENERATOR
+
+    return SDR_TYPE_GENERATOR
+
+
+@pytest.fixture(autouse=True)
+def _patch_ping_finder(mock_ping_finder: PingFinderStub) -> Generator[None, None, None]:
+    """Replace the PingFinder class with the mock for every test."""
+    from radio_telemetry_tracker_drone_fds.ping_finder import ping_finder_module as pfm
+
+    with patch.object(pfm, "PingFinder", return_value=mock_ping_finder):
+        yield
 
 
 @pytest.fixture
-def mock_drone_comms() -> MagicMock:
-    """Fixture for mocked DroneComms."""
-    return cast(MagicMock, MagicMock(spec=DroneComms))
+def ping_finder_module(
+    ping_finder_config: PingFinderConfig,
+    mock_state_manager: StateManager,
+    mock_gps_module: MagicMock,
+) -> PingFinderModule:
+    """Fixture for a PingFinderModule built against the stubbed PingFinder."""
+    from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import PingFinderModule
+
+    return PingFinderModule(
+        gps_module=mock_gps_module,
+        config=ping_finder_config,
+        state_manager=mock_state_manager,
+        sdr_type="GENERATOR",
+    )
 
 
 @pytest.fixture
-def mock_ping_finder() -> MagicMock:
-    """Fixture for mocked PingFinder."""
-    mock = cast(MagicMock, MagicMock(spec=PingFinder))
-    # Ensure start() and stop() methods don't raise exceptions
-    mock.start.return_value = None
-    mock.stop.return_value = None
-    # Mock required attributes
-    mock.sdr_type = SDR_TYPE_GENERATOR
-    mock.gain = TEST_GAIN
-    mock.sampling_rate = TEST_SAMPLING_RATE
-    return mock
-
-
-def test_ping_finder_module_initialization(ping_finder_config: PingFinderConfig, mock_ping_finder: MagicMock) -> None:
-    """Test PingFinderModule initialization."""
-    gps_module = MagicMock()
-    state_manager = StateManager()
-    with patch(
-        "radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module.PingFinder",
-        return_value=mock_ping_finder,
-    ):
-        ping_finder_module = PingFinderModule(
-            gps_module=gps_module,
-            config=ping_finder_config,
-            state_manager=state_manager,
-            sdr_type="GENERATOR",
-        )
-        assert ping_finder_module._ping_finder.sdr_type == SDR_TYPE_GENERATOR  # noqa: S101, SLF001
-
-
-def test_ping_finder_module_start_stop(ping_finder_config: PingFinderConfig, mock_ping_finder: MagicMock) -> None:
-    """Test PingFinderModule start and stop functionality."""
-    gps_module = MagicMock()
-    state_manager = StateManager()
-    with patch(
-        "radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module.PingFinder",
-        return_value=mock_ping_finder,
-    ):
-        ping_finder_module = PingFinderModule(
-            gps_module=gps_module,
-            config=ping_finder_config,
-            state_manager=state_manager,
-            sdr_type="GENERATOR",
-        )
-        state_manager.set_ping_finder_state(PingFinderState.IDLE)
-        ping_finder_module.start()
-        assert state_manager.get_ping_finder_state() == "Running"  # noqa: S101
-        ping_finder_module.stop()
-        assert state_manager.get_ping_finder_state() == "Idle"  # noqa: S101
-
-
-def test_ping_finder_module_callback(ping_finder_config: PingFinderConfig, mock_ping_finder: MagicMock) -> None:
-    """Test PingFinderModule callback functionality."""
-    gps_module = MagicMock()
-    state_manager = StateManager()
-    gps_data = GPSData(timestamp=dt.datetime.now(dt.timezone.utc).timestamp(),
+def online_ping_finder_module(
+    ping_finder_config: PingFinderConfig,
+    mock_state_manager: StateManager,
+    mock_drone_comms: MagicMock,
+    mock_gps_module: MagicMock,
+) -> PingFinderModule:
+    """Fixture for a PingFinderModule wired to mocked DroneComms."""
+    from radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module import PingFinderModule
+
+    return PingFinderModule(
+        gps_module=mock_gps_module,
+        config=ping_finder_config,
+        state_manager=mock_state_manager,
+        sdr_type="GENERATOR",
+        drone_comms=mock_drone_comms,
+    )
+
+
+def test_ping_finder_module_lifecycle(
+    ping_finder_module: PingFinderModule,
+    mock_state_manager: StateManager,
+    sdr_type_generator: int,
+) -> None:
+    """Test init, start, callback and stop on one PingFinderModule instance.
+
+    The phases run in lifecycle order on a single module so construction
+    happens once; assertion messages name the phase that failed.
+    """
+    assert ping_finder_module._ping_finder.sdr_type == sdr_type_generator, "init: wrong sdr_type"  # noqa: S101, SLF001
+
+    mock_state_manager.set_ping_finder_state(PingFinderState.IDLE)
+    ping_finder_module.start()
+    assert mock_state_manager.get_ping_finder_state() == "Running", "start: state not Running"  # noqa: S101
+
+    # Callback while running; logging-only path, so completing without
+    # error is the check.
+    gps_data = GPSData(timestamp=NOW_DT.timestamp(),
                        easting=TEST_EASTING, northing=TEST_NORTHING, altitude=TEST_ALTITUDE)
-    state_manager.update_gps_data(gps_data)
-    with patch(
-        "radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module.PingFinder",
-        return_value=mock_ping_finder,
-    ):
-        ping_finder_module = PingFinderModule(
-            gps_module=gps_module,
-            config=ping_finder_config,
-            state_manager=state_manager,
-            sdr_type="GENERATOR",
-        )
-        # Test the callback functionality
-        ping_finder_module._callback(  # noqa: SLF001
-            dt.datetime.now(dt.timezone.utc),
-            amplitude=TEST_AMPLITUDE,
-            frequency=TEST_CENTER_FREQ,
-        )
-        # Since logging is used, we can only check if the method completes without error
+    mock_state_manager.update_gps_data(gps_data)
+    ping_finder_module._callback(  # noqa: SLF001
+        NOW_DT,
+        amplitude=TEST_AMPLITUDE,
+        frequency=TEST_CENTER_FREQ,
+    )
+
+    ping_finder_module.stop()
+    assert mock_state_manager.get_ping_finder_state() == "Idle", "stop: state not Idle"  # noqa: S101
 
 
 def test_ping_finder_module_online_callback(
-    ping_finder_config: PingFinderConfig, mock_drone_comms: MagicMock, mock_ping_finder: MagicMock,
+    online_ping_finder_module: PingFinderModule,
+    mock_drone_comms: MagicMock,
+    mock_state_manager: StateManager,
 ) -> None:
     """Test PingFinderModule callback functionality in online mode."""
-    gps_module = MagicMock()
-    state_manager = StateManager()
-    gps_data = GPSData(timestamp=dt.datetime.now(dt.timezone.utc).timestamp(),
+    gps_data = GPSData(timestamp=NOW_DT.timestamp(),
                        easting=TEST_EASTING, northing=TEST_NORTHING, altitude=TEST_ALTITUDE)
-    state_manager.update_gps_data(gps_data)
-
-    with patch(
-        "radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module.PingFinder",
-        return_value=mock_ping_finder,
-    ):
-        ping_finder_module = PingFinderModule(
-            gps_module=gps_module,
-            config=ping_finder_config,
-            state_manager=state_manager,
-            sdr_type="GENERATOR",
-            drone_comms=mock_drone_comms,
-        )
-
-        # Test the callback functionality with drone_comms
-        timestamp = dt.datetime.now(dt.timezone.utc)
-        ping_finder_module._callback(  # noqa: SLF001
-            timestamp,
-            amplitude=TEST_AMPLITUDE,
-            frequency=TEST_CENTER_FREQ,
-        )
-
-        # Verify that ping data was sent through drone_comms
-        mock_drone_comms.send_ping_data.assert_called_once()
-        sent_ping_data = mock_drone_comms.send_ping_data.call_args[0][0]
-        assert isinstance(sent_ping_data, PingData)  # noqa: S101
-        assert sent_ping_data.amplitude == TEST_AMPLITUDE  # noqa: S101
-        assert sent_ping_data.frequency == TEST_CENTER_FREQ  # noqa: S101
-        assert sent_ping_data.easting == TEST_EASTING  # noqa: S101
-        assert sent_ping_data.northing == TEST_NORTHING  # noqa: S101
-        assert sent_ping_data.altitude == TEST_ALTITUDE  # noqa: S101
-
-
-def test_ping_finder_module_reconfigure(ping_finder_config: PingFinderConfig, mock_ping_finder: MagicMock) -> None:
+    mock_state_manager.update_gps_data(gps_data)
+
+    # Test the callback functionality with drone_comms
+    online_ping_finder_module._callback(  # noqa: SLF001
+        NOW_DT,
+        amplitude=TEST_AMPLITUDE,
+        frequency=TEST_CENTER_FREQ,
+    )
+
+    # Verify that ping data was sent through drone_comms
+    from radio_telemetry_tracker_drone_comms_package import PingData
+
+    mock_drone_comms.send_ping_data.assert_called_once()
+    sent_ping_data = mock_drone_comms.send_ping_data.call_args[0][0]
+    assert isinstance(sent_ping_data, PingData)  # noqa: S101
+    assert sent_ping_data.amplitude == TEST_AMPLITUDE  # noqa: S101
+    assert sent_ping_data.frequency == TEST_CENTER_FREQ  # noqa: S101
+    assert sent_ping_data.easting == TEST_EASTING  # noqa: S101
+    assert sent_ping_data.northing == TEST_NORTHING  # noqa: S101
+    assert sent_ping_data.altitude == TEST_ALTITUDE  # noqa: S101
+
+
+def test_ping_finder_module_reconfigure(
+    ping_finder_module: PingFinderModule,
+    ping_finder_config: PingFinderConfig,
+    sdr_type_generator: int,
+) -> None:
     """Test PingFinderModule reconfiguration."""
-    gps_module = MagicMock()
-    state_manager = StateManager()
-    with patch(
-        "radio_telemetry_tracker_drone_fds.ping_finder.ping_finder_module.PingFinder",
-        return_value=mock_ping_finder,
-    ):
-        ping_finder_module = PingFinderModule(
-            gps_module=gps_module,
-            config=ping_finder_config,
-            state_manager=state_manager,
-            sdr_type="GENERATOR",
-        )
-
-        # Create new config with different values
-        new_config = PingFinderConfig(
-            gain=TEST_GAIN_NEW,
-            sampling_rate=TEST_SAMPLING_RATE_NEW,
-            center_frequency=ping_finder_config.center_frequency,
-            run_num=ping_finder_config.run_num,
-            enable_test_data=ping_finder_config.enable_test_data,
-            ping_width_ms=ping_finder_config.ping_width_ms,
-            ping_min_snr=ping_finder_config.ping_min_snr,
-            ping_max_len_mult=ping_finder_config.ping_max_len_mult,
-            ping_min_len_mult=ping_finder_config.ping_min_len_mult,
-            target_frequencies=ping_finder_config.target_frequencies,
-            output_dir=ping_finder_config.output_dir,
-        )
-
-        # Test reconfiguration
-        ping_finder_module.reconfigure(new_config, "GENERATOR")
-        assert ping_finder_module._ping_finder.sdr_type == SDR_TYPE_GENERATOR  # noqa: S101, SLF001
-        # Verify that the new configuration was applied
-        assert ping_finder_module._ping_finder.gain == TEST_GAIN_NEW  # noqa: S101, SLF001
-        assert ping_finder_module._ping_finder.sampling_rate == TEST_SAMPLING_RATE_NEW  # noqa: S101, SLF001
+    # Create new config with different values
+    new_config = dataclasses.replace(
+        ping_finder_config,
+        gain=TEST_GAIN_NEW,
+        sampling_rate=TEST_SAMPLING_RATE_NEW,
+    )
+
+    # Test reconfiguration
+    ping_finder_module.reconfigure(new_config, "GENERATOR")
+    assert ping_finder_module._ping_finder.sdr_type == sdr_type_generator  # noqa: S101, SLF001
+    # Verify that the new configuration was applied
+    assert ping_finder_module._ping_finder.gain == TEST_GAIN_NEW  # noqa: S101, SLF001
+    assert ping_finder_module._ping_finder.sampling_rate == TEST_SAMPLING_RATE_NEW  # noqa: S101, SLF001
@@ -1,5 +1,8 @@
 """Tests for StateManager functionality."""
+from __future__ import annotations
+
 import datetime as dt
+from math import isclose
 
 import pytest
 
@@ -11,43 +14,65 @@ TEST_LAT = 32.7157
 TEST_LON = -117.1611
 TEST_ALTITUDE = 545.4
 
-def test_state_manager_gps_state() -> None:
+# Reference timestamp taken once at import; tests only need distinct,
+# ordered timestamps, not the actual current time.
+NOW_TS = dt.datetime.now(dt.timezone.utc).timestamp()
+
+@pytest.mark.parametrize(
+    ("state", "expected"),
+    [
+        (None, "Uncreated"),
+        (GPSState.INITIALIZING, "Initializing"),
+        (GPSState.RUNNING, "Running"),
+        (GPSState.ERROR, "Error"),
+    ],
+    ids=["initial", "initializing", "running", "error"],
+)
+def test_state_manager_gps_state(
+    mock_state_manager: StateManager, state: GPSState | None, expected: str,
+) -> None:
     """Test StateManager's GPS state functionality."""
-    state_manager = StateManager()
-    assert state_manager.get_gps_state() == "Uncreated"  # noqa: S101
-    state_manager.set_gps_state(GPSState.INITIALIZING)
-    assert state_manager.get_gps_state() == "Initializing"  # noqa: S101
-    state_manager.set_gps_state(GPSState.RUNNING)
-    assert state_manager.get_gps_state() == "Running"  # noqa: S101
-    state_manager.set_gps_state(GPSState.ERROR)
-    assert state_manager.get_gps_state() == "Error"  # noqa: S101
-
-def test_state_manager_update_gps_data() -> None:
-    """Test StateManager's GPS data functionality."""
-    state_manager = StateManager()
-    gps_data = GPSData(latitude=TEST_LAT, longitude=TEST_LON, altitude=TEST_ALTITUDE)
-    state_manager.update_gps_data(gps_data)
-    current_data = state_manager.get_current_gps_data()
-    assert current_data.latitude == TEST_LAT  # noqa: S101
+    if state is not None:
+        mock_state_manager.set_gps_state(state)
+    assert mock_state_manager.get_gps_state() == expected  # noqa: S101
+
+@pytest.mark.parametrize(
+    ("updates", "expected_lat"),
+    [
+        ((GPSData(latitude=TEST_LAT, longitude=TEST_LON, altitude=TEST_ALTITUDE),), TEST_LAT),
+        (
+            (
+                GPSData(timestamp=NOW_TS, latitude=TEST_LAT, longitude=TEST_LON),
+                GPSData(timestamp=NOW_TS + 1e-3, latitude=TEST_LAT + 0.0001, longitude=TEST_LON),
+            ),
+            TEST_LAT + 0.0001,
+        ),
+    ],
+    ids=["single-update", "latest-wins"],
+)
+def test_state_manager_update_gps_data(
+    mock_state_manager: StateManager, updates: tuple[GPSData, ...], expected_lat: float,
+) -> None:
+    """Test that update_gps_data makes the newest fix current."""
+    for payload in updates:
+        mock_state_manager.update_gps_data(payload)
+    current_data = mock_state_manager.get_current_gps_data()
+    assert isclose(current_data.latitude, expected_lat, rel_tol=1e-6)  # noqa: S101
     assert current_data.longitude == TEST_LON  # noqa: S101
 
-def test_state_manager_gps_data_history() -> None:
-    """Test GPS data history functionality."""
-    state_manager = StateManager()
-    gps_data = GPSData(
-        timestamp=dt.datetime.now(dt.timezone.utc).timestamp(),
-        latitude=TEST_LAT,
-        longitude=TEST_LON,
-    )
-    state_manager.update_gps_data(gps_data)
-
-    # Create slightly different data
-    new_data = GPSData(
-        timestamp=dt.datetime.now(dt.timezone.utc).timestamp(),
-        latitude=TEST_LAT + 0.0001,
-        longitude=TEST_LON,
-    )
-    state_manager.update_gps_data(new_data)
-
-    data = state_manager.get_current_gps_data()
-    assert data.latitude == pytest.approx(TEST_LAT + 0.0001, rel=1e-6)  # noqa: S101
+def test_state_manager_get_gps_data_closest_to(mock_state_manager: StateManager) -> None:
+    """Test retrieval of the GPS data closest to a given timestamp."""
+    assert mock_state_manager.get_gps_data_closest_to(0.0) is None  # noqa: S101
+
+    for i in range(5):
+        mock_state_manager.update_gps_data(
+            GPSData(timestamp=NOW_TS + i, latitude=TEST_LAT + i, longitude=TEST_LON),
+        )
+
+    closest = mock_state_manager.get_gps_data_closest_to(NOW_TS + 2.4)
+    assert closest is not None  # noqa: S101
+    assert closest.latitude == TEST_LAT + 2  # noqa: S101
+
+    # Requests outside the recorded range clamp to the nearest end
+    assert mock_state_manager.get_gps_data_closest_to(NOW_TS - 10).latitude == TEST_LAT  # noqa: S101
+    assert mock_state_manager.get_gps_data_closest_to(NOW_TS + 10).latitude == TEST_LAT + 4  # noqa: S101